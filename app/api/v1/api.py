@@ -3,4 +3,9 @@ from app.api.v1.endpoints import token, validate
 
 api_router = APIRouter()
 api_router.include_router(token.router, tags=["tokens"])
-api_router.include_router(validate.router, tags=["validation"])
\ No newline at end of file
+api_router.include_router(validate.router, tags=["validation"])
+
+# Guard against a router being included twice (e.g. after a bad merge),
+# which would register every route twice
+_route_keys = {(route.path, frozenset(route.methods)) for route in api_router.routes}
+assert len(_route_keys) == len(api_router.routes), "Duplicate API routes registered"
@@ -2,7 +2,7 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.core.security import verify_token, TokenData
 from app.services.user_validation import user_validation_service, UserValidationService
-from jose import JWTError
+from jwt import InvalidTokenError as JWTError
 
 
 security = HTTPBearer()
@@ -55,7 +55,7 @@ async def get_current_active_user(
     return current_user
 
 
-def get_user_validation_service() -> UserValidationService:
+async def get_user_validation_service() -> UserValidationService:
     """
     Dependency to get the user validation service.
     
@@ -75,8 +75,10 @@ def require_scopes(*required_scopes: str):
     Returns:
         Dependency function that validates user has required scopes
     """
-    def check_scopes(current_user: TokenData = Depends(get_current_user)) -> TokenData:
-        if not all(scope in current_user.scopes for scope in required_scopes):
+    required = frozenset(required_scopes)
+    
+    async def check_scopes(current_user: TokenData = Depends(get_current_user)) -> TokenData:
+        if not required <= current_user.scope_set:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Insufficient permissions"
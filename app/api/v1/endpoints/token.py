@@ -2,18 +2,25 @@ from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel
+from app.core.responses import FastORJSONResponse
 from app.core.security import create_access_token, Token
 from app.services.user_validation import (
     UserValidationService, 
     UserCredentials,
+    UserServiceUnavailableError,
     user_validation_service
 )
 from app.api.v1.deps import get_user_validation_service
-from shared_infra.config.settings import settings
+from shared_infra.config.settings import get_settings
 
+settings = get_settings()
 
 router = APIRouter()
 
+# Settings are fixed for the process lifetime, so derive these once
+_ACCESS_TOKEN_EXPIRES = timedelta(minutes=settings.JWT_EXPIRE_MINUTES)
+_EXPIRES_IN_SECONDS = settings.JWT_EXPIRE_MINUTES * 60
+
 
 class TokenRequest(BaseModel):
     username: str
@@ -33,31 +40,45 @@ class TokenResponse(BaseModel):
     email: str
 
 
-@router.post("/tokens", response_model=TokenResponse)
-async def create_token(
-    token_request: TokenRequest,
-    user_service: UserValidationService = Depends(get_user_validation_service)
-):
+def _unavailable(error: UserServiceUnavailableError) -> HTTPException:
+    """Map a fail-fast user service error to 503 Service Unavailable."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(error)
+    )
+
+
+async def _issue_token(
+    user_service: UserValidationService,
+    username: str,
+    password: str
+) -> dict:
     """
-    Create a new access token for valid user credentials.
+    Validate credentials with the user service and mint an access token.
     
     Args:
-        token_request: User credentials for token creation
-        user_service: User validation service dependency
+        user_service: User validation service
+        username: Username (email) to validate
+        password: Password to validate
     
     Returns:
-        TokenResponse with access token and user information
+        TokenResponse-shaped dict with access token and user information
     
     Raises:
-        HTTPException: If credentials are invalid
+        HTTPException: If credentials are invalid (401) or the user service
+            is unavailable (503)
     """
-    # Validate user credentials
-    credentials = UserCredentials(
-        username=token_request.username,
-        password=token_request.password
+    # Validate user credentials; the fields were already validated as part
+    # of the request, so skip re-validating them
+    credentials = UserCredentials.model_construct(
+        username=username,
+        password=password
     )
     
-    validation_result = await user_service.validate_user_credentials(credentials)
+    try:
+        validation_result = await user_service.validate_user_credentials(credentials)
+    except UserServiceUnavailableError as e:
+        raise _unavailable(e)
     
     if not validation_result.valid:
         raise HTTPException(
@@ -73,24 +94,49 @@ async def create_token(
         "scopes": validation_result.scopes
     }
     
-    access_token_expires = timedelta(minutes=settings.JWT_EXPIRE_MINUTES)
     access_token = create_access_token(
         subject=validation_result.user_id,
         user_data=user_data,
-        expires_delta=access_token_expires
+        expires_delta=_ACCESS_TOKEN_EXPIRES
     )
     
-    return TokenResponse(
-        access_token=access_token,
-        token_type="bearer",
-        expires_in=settings.JWT_EXPIRE_MINUTES * 60,  # Convert to seconds
-        user_id=validation_result.user_id,
-        username=validation_result.username,
-        email=validation_result.email
-    )
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "expires_in": _EXPIRES_IN_SECONDS,
+        "user_id": validation_result.user_id,
+        "username": validation_result.username,
+        "email": validation_result.email
+    }
 
 
-@router.post("/tokens/by-user-id", response_model=TokenResponse)
+@router.post("/tokens", responses={200: {"model": TokenResponse}})
+async def create_token(
+    token_request: TokenRequest,
+    user_service: UserValidationService = Depends(get_user_validation_service)
+):
+    """
+    Create a new access token for valid user credentials.
+    
+    Args:
+        token_request: User credentials for token creation
+        user_service: User validation service dependency
+    
+    Returns:
+        FastORJSONResponse with the access token and user information
+    
+    Raises:
+        HTTPException: If credentials are invalid (401) or the user service
+            is unavailable (503)
+    """
+    return FastORJSONResponse(await _issue_token(
+        user_service,
+        token_request.username,
+        token_request.password
+    ))
+
+
+@router.post("/tokens/by-user-id", responses={200: {"model": TokenResponse}})
 async def create_token_by_user_id(
     request: TokenByUserIdRequest,
     user_service: UserValidationService = Depends(get_user_validation_service)
@@ -105,13 +151,17 @@ async def create_token_by_user_id(
         user_service: User validation service dependency
     
     Returns:
-        TokenResponse with access token and user information
+        FastORJSONResponse with the access token and user information
     
     Raises:
-        HTTPException: If user is not found or inactive
+        HTTPException: If user is not found or inactive, or the user service
+            is unavailable (503)
     """
     # Get user information by ID
-    user_data = await user_service.get_user_by_id(request.user_id)
+    try:
+        user_data = await user_service.get_user_by_id(request.user_id)
+    except UserServiceUnavailableError as e:
+        raise _unavailable(e)
     
     if not user_data:
         raise HTTPException(
@@ -130,27 +180,26 @@ async def create_token_by_user_id(
     token_user_data = {
         "username": user_data.get("username", user_data.get("email")),
         "email": user_data.get("email"),
-        "scopes": user_data.get("scopes", ["read"])
+        "scopes": user_data.get("scopes", ("read",))
     }
     
-    access_token_expires = timedelta(minutes=settings.JWT_EXPIRE_MINUTES)
     access_token = create_access_token(
         subject=request.user_id,
         user_data=token_user_data,
-        expires_delta=access_token_expires
+        expires_delta=_ACCESS_TOKEN_EXPIRES
     )
     
-    return TokenResponse(
-        access_token=access_token,
-        token_type="bearer",
-        expires_in=settings.JWT_EXPIRE_MINUTES * 60,  # Convert to seconds
-        user_id=request.user_id,
-        username=token_user_data["username"],
-        email=token_user_data["email"]
-    )
+    return FastORJSONResponse({
+        "access_token": access_token,
+        "token_type": "bearer",
+        "expires_in": _EXPIRES_IN_SECONDS,
+        "user_id": request.user_id,
+        "username": token_user_data["username"],
+        "email": token_user_data["email"]
+    })
 
 
-@router.post("/tokens/oauth", response_model=TokenResponse)
+@router.post("/tokens/oauth", responses={200: {"model": TokenResponse}})
 async def create_token_oauth(
     form_data: OAuth2PasswordRequestForm = Depends(),
     user_service: UserValidationService = Depends(get_user_validation_service)
@@ -163,45 +212,14 @@ async def create_token_oauth(
         user_service: User validation service dependency
     
     Returns:
-        TokenResponse with access token and user information
+        FastORJSONResponse with the access token and user information
     
     Raises:
-        HTTPException: If credentials are invalid
+        HTTPException: If credentials are invalid (401) or the user service
+            is unavailable (503)
     """
-    # Validate user credentials
-    credentials = UserCredentials(
-        username=form_data.username,
-        password=form_data.password
-    )
-    
-    validation_result = await user_service.validate_user_credentials(credentials)
-    
-    if not validation_result.valid:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=validation_result.message or "Invalid credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    # Create token with user data
-    user_data = {
-        "username": validation_result.username,
-        "email": validation_result.email,
-        "scopes": validation_result.scopes
-    }
-    
-    access_token_expires = timedelta(minutes=settings.JWT_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        subject=validation_result.user_id,
-        user_data=user_data,
-        expires_delta=access_token_expires
-    )
-    
-    return TokenResponse(
-        access_token=access_token,
-        token_type="bearer",
-        expires_in=settings.JWT_EXPIRE_MINUTES * 60,  # Convert to seconds
-        user_id=validation_result.user_id,
-        username=validation_result.username,
-        email=validation_result.email
-    )
\ No newline at end of file
+    return FastORJSONResponse(await _issue_token(
+        user_service,
+        form_data.username,
+        form_data.password
+    ))
\ No newline at end of file
@@ -1,7 +1,9 @@
+from datetime import datetime
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel
-from app.core.security import verify_token, get_token_expiration, TokenValidationResponse
-from jose import JWTError
+from app.core.responses import FastORJSONResponse
+from app.core.security import verify_token, TokenValidationResponse
+from jwt import InvalidTokenError as JWTError
 
 
 router = APIRouter()
@@ -16,12 +18,25 @@ class ValidateTokenResponse(BaseModel):
     user_id: str = None
     username: str = None
     email: str = None
-    scopes: list[str] = []
+    scopes: tuple[str, ...] = ()
     expires_at: str = None
     message: str = None
 
 
-@router.post("/validate", response_model=ValidateTokenResponse)
+def _invalid_response(message: str) -> dict:
+    """Build a ValidateTokenResponse-shaped dict for a rejected token."""
+    return {
+        "valid": False,
+        "user_id": None,
+        "username": None,
+        "email": None,
+        "scopes": (),
+        "expires_at": None,
+        "message": message
+    }
+
+
+@router.post("/validate", responses={200: {"model": ValidateTokenResponse}})
 async def validate_token(request: ValidateTokenRequest):
     """
     Validate a JWT token and return user information.
@@ -30,36 +45,32 @@ async def validate_token(request: ValidateTokenRequest):
         request: Token validation request containing the token to validate
     
     Returns:
-        ValidateTokenResponse with validation result and user data
+        FastORJSONResponse with the validation result and user data
     """
     try:
-        # Verify the token
+        # Verify the token; the verified payload already carries exp
         token_data = verify_token(request.token)
         
-        # Get expiration time
-        expires_at = get_token_expiration(request.token)
-        expires_at_str = expires_at.isoformat() if expires_at else None
-        
-        return ValidateTokenResponse(
-            valid=True,
-            user_id=token_data.user_id,
-            username=token_data.username,
-            email=token_data.email,
-            scopes=token_data.scopes,
-            expires_at=expires_at_str,
-            message="Token is valid"
+        expires_at_str = (
+            datetime.utcfromtimestamp(token_data.exp).isoformat()
+            if token_data.exp
+            else None
         )
+        
+        return FastORJSONResponse({
+            "valid": True,
+            "user_id": token_data.user_id,
+            "username": token_data.username,
+            "email": token_data.email,
+            "scopes": token_data.scopes,
+            "expires_at": expires_at_str,
+            "message": "Token is valid"
+        })
     
     except JWTError as e:
-        return ValidateTokenResponse(
-            valid=False,
-            message=f"Token validation failed: {str(e)}"
-        )
+        return FastORJSONResponse(_invalid_response(f"Token validation failed: {str(e)}"))
     except Exception as e:
-        return ValidateTokenResponse(
-            valid=False,
-            message=f"Unexpected error: {str(e)}"
-        )
+        return FastORJSONResponse(_invalid_response(f"Unexpected error: {str(e)}"))
 
 
 @router.post("/validate/bearer")
@@ -71,13 +82,12 @@ async def validate_bearer_token(request: ValidateTokenRequest):
         request: Token validation request containing the token to validate
     
     Returns:
-        Dictionary with validation result
+        FastORJSONResponse with a ValidateTokenResponse-shaped body
     """
-    result = await validate_token(request)
-    return result.dict()
+    return await validate_token(request)
 
 
-@router.get("/validate/me", response_model=ValidateTokenResponse)
+@router.get("/validate/me", responses={200: {"model": ValidateTokenResponse}})
 async def validate_current_token(token: str):
     """
     Validate token passed as query parameter.
@@ -86,7 +96,7 @@ async def validate_current_token(token: str):
         token: JWT token as query parameter
     
     Returns:
-        ValidateTokenResponse with validation result
+        FastORJSONResponse with a ValidateTokenResponse-shaped body
     """
     request = ValidateTokenRequest(token=token)
     return await validate_token(request)
\ No newline at end of file
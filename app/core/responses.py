@@ -0,0 +1,19 @@
+from typing import Any
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+class FastORJSONResponse(ORJSONResponse):
+    """
+    ORJSONResponse with the orjson options this service relies on.
+    
+    FastAPI runs jsonable_encoder over any plain value an endpoint returns
+    before rendering it, so the hot endpoints return this response directly
+    and orjson serializes their content in a single pass. orjson handles
+    UUIDs and datetimes natively, so no default= callback is needed.
+    """
+    
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=self.option)
@@ -1,15 +1,32 @@
+import base64
+import hashlib
+import hmac
+import time
 from datetime import datetime, timedelta
+from functools import cached_property
 from typing import Any, Union, Optional
-from jose import jwt, JWTError
+from cachetools import TTLCache
+import jwt
+from jwt import InvalidTokenError as JWTError
+from jwt.algorithms import get_default_algorithms
+import orjson
 from pydantic import BaseModel
-from shared_infra.config.settings import settings
+from shared_infra.config.settings import get_settings
+
+settings = get_settings()
 
 
 class TokenData(BaseModel):
     user_id: Optional[str] = None
     username: Optional[str] = None
     email: Optional[str] = None
-    scopes: list[str] = []
+    scopes: tuple[str, ...] = ()
+    exp: Optional[int] = None
+    
+    @cached_property
+    def scope_set(self) -> frozenset[str]:
+        """The token's scopes as a set, for require_scopes' subset check."""
+        return frozenset(self.scopes)
 
 
 class Token(BaseModel):
@@ -23,10 +40,69 @@ class TokenValidationResponse(BaseModel):
     user_id: Optional[str] = None
     username: Optional[str] = None
     email: Optional[str] = None
-    scopes: list[str] = []
+    scopes: tuple[str, ...] = ()
     expires_at: Optional[datetime] = None
 
 
+# Settings are fixed for the process lifetime; bind the values used on
+# every sign/verify call once instead of reading them off settings
+_JWT_ALGORITHM = settings.JWT_ALGORITHM
+_JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+_DEFAULT_EXPIRES_SECONDS = settings.JWT_EXPIRE_MINUTES * 60
+
+
+def _load_jwt_keys() -> tuple[Any, Any]:
+    """
+    Prepare the signing and verification keys once at import.
+    
+    HMAC algorithms use JWT_SECRET as bytes for both. Asymmetric algorithms
+    (e.g. EdDSA, RS256) load JWT_PRIVATE_KEY / JWT_PUBLIC_KEY from PEM into
+    key objects so they are not re-parsed on every call; either may be
+    left empty for a sign-only or verify-only deployment.
+    
+    Returns:
+        Tuple of (signing key, verification key)
+    """
+    if _JWT_ALGORITHM.startswith("HS"):
+        key = settings.JWT_SECRET.encode()
+        return key, key
+    
+    algorithm = get_default_algorithms()[_JWT_ALGORITHM]
+    signing_key = (
+        algorithm.prepare_key(settings.JWT_PRIVATE_KEY)
+        if settings.JWT_PRIVATE_KEY
+        else None
+    )
+    verifying_key = (
+        algorithm.prepare_key(settings.JWT_PUBLIC_KEY)
+        if settings.JWT_PUBLIC_KEY
+        else None
+    )
+    return signing_key, verifying_key
+
+
+_JWT_SIGNING_KEY, _JWT_VERIFYING_KEY = _load_jwt_keys()
+
+# HMAC algorithms are verified by _fast_verify_hmac; others go through PyJWT
+_HMAC_DIGESTS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+_HMAC_DIGEST = _HMAC_DIGESTS.get(_JWT_ALGORITHM)
+
+# Cache of verified tokens keyed by sha256(token) -> TokenData.
+# Disabled when TOKEN_CACHE_TTL_SECONDS is 0.
+_verified_token_cache: Optional[TTLCache] = (
+    TTLCache(
+        maxsize=settings.TOKEN_CACHE_MAX_SIZE,
+        ttl=settings.TOKEN_CACHE_TTL_SECONDS
+    )
+    if settings.TOKEN_CACHE_TTL_SECONDS > 0
+    else None
+)
+
+
 def create_access_token(
     subject: Union[str, Any], 
     user_data: dict = None, 
@@ -43,14 +119,16 @@ def create_access_token(
     Returns:
         Encoded JWT token string
     """
+    # JWT time claims are integer seconds since the epoch
+    now = int(time.time())
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.JWT_EXPIRE_MINUTES)
+        expire = now + _DEFAULT_EXPIRES_SECONDS
     
     to_encode = {
         "exp": expire,
-        "iat": datetime.utcnow(),
+        "iat": now,
         "sub": str(subject),
     }
     
@@ -59,8 +137,8 @@ def create_access_token(
     
     encoded_jwt = jwt.encode(
         to_encode, 
-        settings.JWT_SECRET, 
-        algorithm=settings.JWT_ALGORITHM
+        _JWT_SIGNING_KEY, 
+        algorithm=_JWT_ALGORITHM
     )
     return encoded_jwt
 
@@ -73,55 +151,202 @@ def verify_token(token: str) -> TokenData:
         token: The JWT token string to verify
     
     Returns:
-        TokenData object with decoded information
+        TokenData object with decoded information, including the exp claim
     
     Raises:
         JWTError: If the token is invalid or expired
     """
+    cache_key = None
+    if _verified_token_cache is not None:
+        cache_key = hashlib.sha256(token.encode()).digest()
+        token_data = _verified_token_cache.get(cache_key)
+        if token_data is not None:
+            if token_data.exp is None or time.time() < token_data.exp:
+                return token_data
+            # Expired since it was cached; the exp check below rejects it
+            _verified_token_cache.pop(cache_key, None)
+    
     try:
-        payload = jwt.decode(
-            token, 
-            settings.JWT_SECRET, 
-            algorithms=[settings.JWT_ALGORITHM]
-        )
+        if _HMAC_DIGEST is not None:
+            payload = _fast_verify_hmac(token)
+        else:
+            # Reject expired tokens from the unverified exp claim before
+            # paying for signature verification
+            exp = _get_token_exp_timestamp(token)
+            if isinstance(exp, (int, float)) and exp <= time.time():
+                raise jwt.ExpiredSignatureError("Signature has expired")
+            
+            payload = jwt.decode(
+                token, 
+                _JWT_VERIFYING_KEY, 
+                algorithms=_JWT_ALGORITHMS
+            )
         
         user_id: str = payload.get("sub")
         if user_id is None:
             raise JWTError("Token missing subject")
         
-        token_data = TokenData(
+        # exp has been validated, but may be a float or numeric string
+        exp = payload.get("exp")
+        if exp is not None:
+            exp = int(exp)
+        
+        # The payload was signed by this service and has just been
+        # verified, so build TokenData without re-running validation
+        token_data = TokenData.model_construct(
             user_id=user_id,
             username=payload.get("username"),
             email=payload.get("email"),
-            scopes=payload.get("scopes", [])
+            scopes=tuple(payload.get("scopes") or ()),
+            exp=exp
         )
+        
+        if cache_key is not None:
+            _verified_token_cache[cache_key] = token_data
         return token_data
     
     except JWTError as e:
         raise JWTError(f"Token validation failed: {str(e)}")
 
 
-def get_token_expiration(token: str) -> Optional[datetime]:
+def _b64url_decode(segment: bytes) -> bytes:
+    """Decode an unpadded base64url JWT segment."""
+    return base64.urlsafe_b64decode(segment + b"=" * (-len(segment) % 4))
+
+
+def _fast_verify_hmac(token: str) -> dict:
     """
-    Get the expiration datetime from a JWT token without full validation.
+    Verify an HMAC-signed JWT directly with hmac/hashlib.
+    
+    Reproduces jwt.decode's token parsing and claim checks (pinned alg,
+    signature, exp, iat, nbf, no unexpected aud) without PyJWT's generic
+    algorithm dispatch; tests/test_security.py checks the two agree on
+    tokens with a single defect. PyJWT's key checks (e.g. refusing a
+    PEM-looking HMAC secret) are not reproduced. exp is checked before the
+    HMAC so expired tokens are rejected without computing a signature; a
+    token with several defects may therefore fail with a different error
+    than jwt.decode would raise.
+    
+    Args:
+        token: The JWT token string to verify
+    
+    Returns:
+        Decoded payload dictionary
+    
+    Raises:
+        JWTError: If the token is malformed, mis-signed, expired or not yet valid
+    """
+    try:
+        signing_input, _, signature_b64 = token.encode("ascii").rpartition(b".")
+        header_b64, separator, payload_b64 = signing_input.partition(b".")
+        if not separator or b"." in payload_b64:
+            raise jwt.DecodeError("Wrong number of segments")
+        header = orjson.loads(_b64url_decode(header_b64))
+        payload = orjson.loads(_b64url_decode(payload_b64))
+        signature = _b64url_decode(signature_b64)
+    except ValueError:
+        # Covers non-ASCII input, bad base64 and bad JSON
+        raise jwt.DecodeError("Invalid token encoding")
+    
+    if not isinstance(header, dict) or not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid token header or payload")
+    if header.get("b64", True) is False:
+        # Detached payloads are never issued by this service
+        raise jwt.DecodeError("Unencoded payloads are not supported")
+    if header.get("alg") != _JWT_ALGORITHM:
+        raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+    
+    now = time.time()
+    if "exp" in payload:
+        exp = _int_claim(
+            payload["exp"],
+            jwt.DecodeError("Expiration Time claim (exp) must be an integer.")
+        )
+        if exp <= now:
+            raise jwt.ExpiredSignatureError("Signature has expired")
+    
+    expected = hmac.new(_JWT_VERIFYING_KEY, signing_input, _HMAC_DIGEST).digest()
+    if not hmac.compare_digest(expected, signature):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+    
+    if "iat" in payload:
+        iat = _int_claim(
+            payload["iat"],
+            jwt.InvalidIssuedAtError("Issued At claim (iat) must be an integer.")
+        )
+        if iat > now:
+            raise jwt.ImmatureSignatureError("The token is not yet valid (iat)")
+    if "nbf" in payload:
+        nbf = _int_claim(
+            payload["nbf"],
+            jwt.DecodeError("Not Before claim (nbf) must be an integer.")
+        )
+        if nbf > now:
+            raise jwt.ImmatureSignatureError("The token is not yet valid (nbf)")
+    if payload.get("aud"):
+        # jwt.decode is called without an audience, so it rejects any aud
+        raise jwt.InvalidAudienceError("Invalid audience")
+    
+    return payload
+
+
+def _int_claim(value: Any, error: JWTError) -> int:
+    """
+    Convert a time claim with int(), as PyJWT does.
+    
+    Args:
+        value: Raw claim value from the payload
+        error: Error to raise if the value is not a number
+    
+    Returns:
+        Claim as integer seconds since the epoch
+    
+    Raises:
+        JWTError: The given error, if the value cannot be converted
+    """
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        raise error
+
+
+def _get_token_exp_timestamp(token: str) -> Optional[int]:
+    """
+    Get the raw exp claim from a JWT token without full validation.
     
     Args:
         token: The JWT token string
     
     Returns:
-        Expiration datetime or None if not found
+        Expiration as seconds since the epoch or None if not found
     """
     try:
         # Decode without verification to get expiration
-        unverified_payload = jwt.get_unverified_claims(token)
-        exp_timestamp = unverified_payload.get("exp")
-        if exp_timestamp:
-            return datetime.utcfromtimestamp(exp_timestamp)
-        return None
+        unverified_payload = jwt.decode(
+            token,
+            options={"verify_signature": False}
+        )
+        return unverified_payload.get("exp") or None
     except Exception:
         return None
 
 
+def get_token_expiration(token: str) -> Optional[datetime]:
+    """
+    Get the expiration datetime from a JWT token without full validation.
+    
+    Args:
+        token: The JWT token string
+    
+    Returns:
+        Expiration datetime or None if not found
+    """
+    exp_timestamp = _get_token_exp_timestamp(token)
+    if exp_timestamp:
+        return datetime.utcfromtimestamp(exp_timestamp)
+    return None
+
+
 def is_token_expired(token: str) -> bool:
     """
     Check if a token is expired without full validation.
@@ -132,7 +357,7 @@ def is_token_expired(token: str) -> bool:
     Returns:
         True if expired, False otherwise
     """
-    exp_time = get_token_expiration(token)
-    if exp_time:
-        return datetime.utcnow() > exp_time
+    exp_timestamp = _get_token_exp_timestamp(token)
+    if exp_timestamp:
+        return time.time() > exp_timestamp
     return True  # Assume expired if we can't determine expiration
\ No newline at end of file
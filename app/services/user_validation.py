@@ -1,7 +1,13 @@
+import asyncio
+import time
 import httpx
+import orjson
 from typing import Optional, Dict, Any
+from cachetools import TTLCache
 from pydantic import BaseModel
-from shared_infra.config.settings import settings
+from shared_infra.config.settings import get_settings
+
+settings = get_settings()
 
 
 class UserCredentials(BaseModel):
@@ -14,14 +20,108 @@ class UserValidationResponse(BaseModel):
     user_id: Optional[str] = None
     username: Optional[str] = None
     email: Optional[str] = None
-    scopes: list[str] = []
+    scopes: tuple[str, ...] = ()
     message: Optional[str] = None
 
 
+class UserServiceUnavailableError(Exception):
+    """Raised instead of calling the user service while it is failing or saturated."""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for outbound calls.
+    
+    After `threshold` consecutive failures the breaker opens and callers
+    should fail fast for `reset_seconds`; after that, calls are let through
+    again and the next success closes it. A threshold of 0 disables it.
+    """
+    
+    def __init__(self, threshold: int, reset_seconds: float):
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at = 0.0
+    
+    @property
+    def is_open(self) -> bool:
+        return (
+            self.threshold > 0
+            and self._failures >= self.threshold
+            and time.monotonic() - self._opened_at < self.reset_seconds
+        )
+    
+    def record_success(self) -> None:
+        self._failures = 0
+    
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._failures >= self.threshold:
+            self._opened_at = time.monotonic()
+
+
 class UserValidationService:
     def __init__(self):
         self.base_url = settings.USER_SERVICE_URL
         self.timeout = settings.USER_SERVICE_TIMEOUT
+        # Shared client so connections to the user service are pooled
+        # across requests instead of reconnecting on every call; created
+        # lazily so a new one is opened after aclose()
+        self._client: Optional[httpx.AsyncClient] = None
+        # Short-lived cache of user lookups. Concurrent misses for the same
+        # user await one in-flight fetch task and all get its result
+        self._user_cache: Optional[TTLCache] = (
+            TTLCache(
+                maxsize=settings.USER_CACHE_MAX_SIZE,
+                ttl=settings.USER_CACHE_TTL_SECONDS
+            )
+            if settings.USER_CACHE_TTL_SECONDS > 0
+            else None
+        )
+        self._user_fetches: Dict[str, asyncio.Task] = {}
+        # Bound in-flight upstream calls and fail fast, instead of piling up
+        # waiting requests, when the limit is reached or the user service
+        # is unreachable
+        self._semaphore = asyncio.Semaphore(settings.USER_SERVICE_MAX_CONCURRENCY)
+        self._breaker = CircuitBreaker(
+            threshold=settings.USER_SERVICE_BREAKER_THRESHOLD,
+            reset_seconds=settings.USER_SERVICE_BREAKER_RESET_SECONDS
+        )
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use or after aclose()."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=settings.USER_SERVICE_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.USER_SERVICE_MAX_KEEPALIVE_CONNECTIONS
+                ),
+                # Multiplexes concurrent requests over one connection when the
+                # user service is reached over TLS
+                http2=True
+            )
+        return self._client
+    
+    def _check_available(self) -> None:
+        """
+        Fail fast instead of calling the user service.
+        
+        Raises:
+            UserServiceUnavailableError: If the circuit breaker is open or
+                USER_SERVICE_MAX_CONCURRENCY calls are already in flight
+        """
+        if self._breaker.is_open:
+            raise UserServiceUnavailableError("User service unavailable")
+        if self._semaphore.locked():
+            raise UserServiceUnavailableError("Too many user service requests in flight")
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client; the next call opens a new one."""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
     
     async def validate_user_credentials(
         self, 
@@ -35,58 +135,69 @@ class UserValidationService:
         
         Returns:
             UserValidationResponse with validation result and user data
+        
+        Raises:
+            UserServiceUnavailableError: If the user service is not called
+                because it is failing or saturated
         """
+        self._check_available()
+        
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/v1/auth/login",
-                    json={
+            async with self._semaphore:
+                response = await self._get_client().post(
+                    "/api/v1/auth/login",
+                    content=orjson.dumps({
                         "email": credentials.username,  # Assuming username is email
                         "password": credentials.password
-                    },
+                    }),
                     headers={
                         "Content-Type": "application/json"
                     }
                 )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    return UserValidationResponse(
-                        valid=True,
-                        user_id=data.get("user_id"),
-                        username=data.get("username"),
-                        email=data.get("email"),
-                        scopes=data.get("scopes", []),
-                        message="User validated successfully"
-                    )
-                elif response.status_code == 401:
-                    return UserValidationResponse(
-                        valid=False,
-                        message="Invalid credentials"
-                    )
-                elif response.status_code == 404:
-                    return UserValidationResponse(
-                        valid=False,
-                        message="User not found"
-                    )
-                else:
-                    return UserValidationResponse(
-                        valid=False,
-                        message=f"User service error: {response.status_code}"
-                    )
+            self._breaker.record_success()
+            
+            # Upstream data is validated; failure responses are built from
+            # literals only and skip validation via model_construct
+            if response.status_code == 200:
+                data = response.json()
+                return UserValidationResponse(
+                    valid=True,
+                    user_id=data.get("user_id"),
+                    username=data.get("username"),
+                    email=data.get("email"),
+                    scopes=data.get("scopes", ()),
+                    message="User validated successfully"
+                )
+            elif response.status_code == 401:
+                return UserValidationResponse.model_construct(
+                    valid=False,
+                    message="Invalid credentials"
+                )
+            elif response.status_code == 404:
+                return UserValidationResponse.model_construct(
+                    valid=False,
+                    message="User not found"
+                )
+            else:
+                return UserValidationResponse.model_construct(
+                    valid=False,
+                    message=f"User service error: {response.status_code}"
+                )
         
         except httpx.TimeoutException:
-            return UserValidationResponse(
+            self._breaker.record_failure()
+            return UserValidationResponse.model_construct(
                 valid=False,
                 message="User service timeout"
             )
         except httpx.RequestError as e:
-            return UserValidationResponse(
+            self._breaker.record_failure()
+            return UserValidationResponse.model_construct(
                 valid=False,
                 message=f"User service connection error: {str(e)}"
             )
         except Exception as e:
-            return UserValidationResponse(
+            return UserValidationResponse.model_construct(
                 valid=False,
                 message=f"Unexpected error: {str(e)}"
             )
@@ -100,21 +211,77 @@ class UserValidationService:
         
         Returns:
             User data dictionary or None if not found
+        
+        Raises:
+            UserServiceUnavailableError: If the user service is not called
+                because it is failing or saturated
+        """
+        if self._user_cache is None:
+            return await self._fetch_user_by_id(user_id)
+        
+        user = self._user_cache.get(user_id)
+        if user is not None:
+            return user
+        
+        task = self._user_fetches.get(user_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_cache_user(user_id))
+            self._user_fetches[user_id] = task
+            task.add_done_callback(
+                lambda done: self._forget_user_fetch(user_id, done)
+            )
+        # Shielded so a cancelled caller does not cancel the shared fetch
+        return await asyncio.shield(task)
+    
+    async def _fetch_and_cache_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch a user and cache it if found."""
+        user = await self._fetch_user_by_id(user_id)
+        if user is not None:
+            self._user_cache[user_id] = user
+        return user
+    
+    def _forget_user_fetch(self, user_id: str, task: asyncio.Task) -> None:
+        """Drop a finished fetch task, unless it has already been replaced."""
+        if self._user_fetches.get(user_id) is task:
+            del self._user_fetches[user_id]
+        if not task.cancelled():
+            # Mark a failure as retrieved even if every caller was cancelled
+            task.exception()
+    
+    async def _fetch_user_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
         """
+        Fetch user information from the user management service.
+        
+        Args:
+            user_id: The user ID to look up
+        
+        Returns:
+            User data dictionary or None if not found
+        
+        Raises:
+            UserServiceUnavailableError: If the user service is not called
+                because it is failing or saturated
+        """
+        self._check_available()
+        
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/internal/v1/users/{user_id}",
+            async with self._semaphore:
+                response = await self._get_client().get(
+                    f"/internal/v1/users/{user_id}",
                     headers={
                         "Content-Type": "application/json"
                     }
                 )
-                
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    return None
+            self._breaker.record_success()
+            
+            if response.status_code == 200:
+                return response.json()
+            else:
+                return None
         
+        except httpx.RequestError:
+            self._breaker.record_failure()
+            return None
         except Exception:
             return None
 
@@ -0,0 +1,20 @@
+"""
+Gunicorn configuration for production deployments.
+
+Run with:
+    gunicorn main:app -c gunicorn_conf.py
+
+Each worker is a separate process running its own uvicorn event loop, so
+requests are spread across CPU cores. `python main.py` remains the
+development entry point.
+"""
+from shared_infra.config.settings import get_settings
+
+settings = get_settings()
+
+bind = f"{settings.HOST}:{settings.PORT}"
+# WORKERS defaults to the CPU count
+workers = settings.WORKERS
+# Picks up uvloop and httptools when installed
+worker_class = "uvicorn.workers.UvicornWorker"
+loglevel = settings.LOG_LEVEL
@@ -1,50 +1,101 @@
 import os
-from pydantic_settings import BaseSettings
-from dotenv import load_dotenv
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Any
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-# Load environment variables from .env file
-load_dotenv()
+# String values of DEBUG that enable it; anything else disables it
+_TRUTHY = frozenset({"1", "true", "True", "TRUE", "yes", "Yes", "YES", "on", "On", "ON"})
+
+# The project-root .env, independent of the working directory the
+# service is started from
+_ENV_FILE = Path(__file__).resolve().parents[2] / ".env"
 
 
 class Settings(BaseSettings):
+    # Values are read from the environment (and .env) by pydantic-settings;
+    # the literals below are only defaults. Unrelated .env keys (e.g.
+    # COMPOSE_PROJECT_NAME in .env.docker) are ignored.
+    model_config = SettingsConfigDict(
+        case_sensitive=True,
+        env_file=_ENV_FILE,
+        extra="ignore"
+    )
+    
     # JWT Configuration
-    JWT_SECRET: str = os.getenv("JWT_SECRET", "your-super-secret-jwt-key-change-this-in-production")
-    JWT_ALGORITHM: str = os.getenv("JWT_ALGORITHM", "HS256")
-    JWT_EXPIRE_MINUTES: int = int(os.getenv("JWT_EXPIRE_MINUTES", "1440"))  # 24 hours
+    JWT_SECRET: str = "your-super-secret-jwt-key-change-this-in-production"
+    JWT_ALGORITHM: str = "HS256"
+    # PEM keys for asymmetric algorithms (e.g. EdDSA, RS256)
+    JWT_PRIVATE_KEY: str = ""
+    JWT_PUBLIC_KEY: str = ""
+    JWT_EXPIRE_MINUTES: int = 1440  # 24 hours
+    
+    # Verified token cache (set TTL to 0 to disable)
+    TOKEN_CACHE_TTL_SECONDS: int = 300
+    TOKEN_CACHE_MAX_SIZE: int = 10000
     
     # User Management Service
-    USER_SERVICE_URL: str = os.getenv("USER_SERVICE_URL", "http://localhost:8000")
-    USER_SERVICE_TIMEOUT: int = int(os.getenv("USER_SERVICE_TIMEOUT", "30"))
+    USER_SERVICE_URL: str = "http://localhost:8000"
+    USER_SERVICE_TIMEOUT: int = 30
+    USER_SERVICE_MAX_CONCURRENCY: int = 100
+    USER_SERVICE_MAX_CONNECTIONS: int = 200
+    USER_SERVICE_MAX_KEEPALIVE_CONNECTIONS: int = 100
+    
+    # User service circuit breaker (set threshold to 0 to disable)
+    USER_SERVICE_BREAKER_THRESHOLD: int = 5
+    USER_SERVICE_BREAKER_RESET_SECONDS: int = 30
+    
+    # User lookup cache (set TTL to 0 to disable)
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_SIZE: int = 5000
     
     # API Configuration
-    API_V1_STR: str = os.getenv("API_V1_STR", "/api/v1")
-    PROJECT_NAME: str = os.getenv("PROJECT_NAME", "Auth Tokens Service")
-    VERSION: str = os.getenv("VERSION", "1.0.0")
+    API_V1_STR: str = "/api/v1"
+    PROJECT_NAME: str = "Auth Tokens Service"
+    VERSION: str = "1.0.0"
     
     # Server Configuration
-    HOST: str = os.getenv("HOST", "0.0.0.0")
-    PORT: int = int(os.getenv("PORT", "8080"))
+    HOST: str = "0.0.0.0"
+    PORT: int = 8080
+    WORKERS: int = os.cpu_count() or 1
+    THREADPOOL_SIZE: int = 100
     
     # Environment
-    ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
-    DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
+    ENVIRONMENT: str = "development"
+    DEBUG: bool = False
     
     # Logging
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "info")
+    LOG_LEVEL: str = "info"
     
     # CORS Configuration
-    ALLOWED_ORIGINS: str = os.getenv("ALLOWED_ORIGINS", "*")
+    ALLOWED_ORIGINS: str = "*"
+    CORS_MAX_AGE: int = 86400  # Browser preflight cache, in seconds
     
-    @property
-    def allowed_origins_list(self) -> list:
-        """Convert ALLOWED_ORIGINS string to list."""
-        if self.ALLOWED_ORIGINS == "*":
-            return ["*"]
-        return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",")]
+    @field_validator("DEBUG", mode="before")
+    @classmethod
+    def _parse_debug(cls, value: Any) -> bool:
+        """Parse DEBUG leniently: unknown strings mean False instead of failing."""
+        return value in _TRUTHY if isinstance(value, str) else bool(value)
     
-    class Config:
-        case_sensitive = True
-        env_file = ".env"
+    @cached_property
+    def allowed_origins_list(self) -> tuple[str, ...]:
+        """Parse ALLOWED_ORIGINS into a tuple of origins, once per instance."""
+        if self.ALLOWED_ORIGINS == "*":
+            return ("*",)
+        return tuple(origin.strip() for origin in self.ALLOWED_ORIGINS.split(","))
 
 
-settings = Settings()
\ No newline at end of file
+
+@lru_cache()
+def get_settings() -> Settings:
+    """
+    Return the process-wide Settings instance.
+    
+    The environment and .env file are read once, on first call; later calls
+    (including FastAPI Depends(get_settings)) return the same instance.
+    The app modules bind settings and derive constants from them at
+    import, so get_settings.cache_clear() only picks up a changed
+    environment if it is called before they are imported.
+    """
+    return Settings()
\ No newline at end of file
@@ -0,0 +1,110 @@
+import hmac
+import time
+
+import jwt
+import pytest
+
+from app.core.security import (
+    _HMAC_DIGEST,
+    _JWT_ALGORITHM,
+    _JWT_VERIFYING_KEY,
+    _fast_verify_hmac,
+)
+
+# The token tables below are signed with the HMAC secret at import, so skip
+# before building them
+if _HMAC_DIGEST is None:
+    pytest.skip("fast verifier only handles HMAC algorithms", allow_module_level=True)
+
+NOW = int(time.time())
+HOUR = 3600
+
+
+def _sign(payload: dict, headers: dict = None, key: bytes = None) -> str:
+    return jwt.encode(
+        payload,
+        _JWT_VERIFYING_KEY if key is None else key,
+        algorithm=_JWT_ALGORITHM,
+        headers=headers,
+    )
+
+
+def _with_payload_segment(token: str, segment: str) -> str:
+    """Swap in a raw payload segment, keeping the original signature."""
+    header, _, signature = token.split(".")
+    return f"{header}.{segment}.{signature}"
+
+
+def _resigned(token: str, segment: str) -> str:
+    """Swap in a raw payload segment and sign the result correctly."""
+    header = token.split(".")[0]
+    signing_input = f"{header}.{segment}".encode()
+    signature = hmac.new(_JWT_VERIFYING_KEY, signing_input, _HMAC_DIGEST).digest()
+    return f"{header}.{segment}.{jwt.utils.base64url_encode(signature).decode()}"
+
+
+VALID = {"sub": "u1", "username": "alice", "scopes": ["read"], "exp": NOW + HOUR}
+
+# Each token has at most one defect, so both verifiers must fail the same way
+TOKENS = {
+    "valid": _sign(VALID),
+    "no exp": _sign({"sub": "u1"}),
+    "float exp": _sign({**VALID, "exp": NOW + HOUR + 0.5}),
+    "string exp": _sign({**VALID, "exp": str(NOW + HOUR)}),
+    "past iat": _sign({**VALID, "iat": NOW - HOUR}),
+    "past nbf": _sign({**VALID, "nbf": NOW - HOUR}),
+    "empty aud": _sign({**VALID, "aud": ""}),
+    "expired": _sign({**VALID, "exp": NOW - HOUR}),
+    "non-numeric exp": _sign({**VALID, "exp": "soon"}),
+    "future iat": _sign({**VALID, "iat": NOW + HOUR}),
+    "non-numeric iat": _sign({**VALID, "iat": "now"}),
+    "future nbf": _sign({**VALID, "nbf": NOW + HOUR}),
+    "non-numeric nbf": _sign({**VALID, "nbf": "later"}),
+    "aud": _sign({**VALID, "aud": "other-service"}),
+    "wrong key": _sign(VALID, key=b"not-the-secret"),
+    "wrong alg": jwt.encode(
+        VALID, _JWT_VERIFYING_KEY,
+        algorithm="HS512" if _JWT_ALGORITHM != "HS512" else "HS256"
+    ),
+    "alg none": jwt.encode(VALID, None, algorithm="none"),
+    "tampered payload": _with_payload_segment(
+        _sign(VALID), _sign({**VALID, "sub": "admin"}).split(".")[1]
+    ),
+    "two segments": _sign(VALID).rsplit(".", 1)[0],
+    "four segments": _sign(VALID) + ".x",
+    "bad base64": _resigned(_sign(VALID), "!!!"),
+    "non-json payload": _resigned(_sign(VALID), "bm90IGpzb24"),
+    "non-object payload": _resigned(_sign(VALID), "WzFd"),
+    "garbage": "not-a-token",
+}
+
+# PyJWT raises TypeError rather than a JWT error for these; both must reject
+TYPE_ERROR_TOKENS = {
+    "null exp": _sign({**VALID, "exp": None}),
+    "list iat": _sign({**VALID, "iat": [NOW]}),
+}
+
+
+def _pyjwt_decode(token: str) -> dict:
+    return jwt.decode(token, _JWT_VERIFYING_KEY, algorithms=[_JWT_ALGORITHM])
+
+
+@pytest.mark.parametrize("name", TOKENS)
+def test_fast_verify_matches_pyjwt(name):
+    token = TOKENS[name]
+    try:
+        expected = _pyjwt_decode(token)
+    except jwt.InvalidTokenError as e:
+        with pytest.raises(type(e)):
+            _fast_verify_hmac(token)
+    else:
+        assert _fast_verify_hmac(token) == expected
+
+
+@pytest.mark.parametrize("name", TYPE_ERROR_TOKENS)
+def test_fast_verify_rejects_malformed_claims(name):
+    token = TYPE_ERROR_TOKENS[name]
+    with pytest.raises(Exception):
+        _pyjwt_decode(token)
+    with pytest.raises(jwt.InvalidTokenError):
+        _fast_verify_hmac(token)
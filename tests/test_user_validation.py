@@ -0,0 +1,98 @@
+import asyncio
+
+import httpx
+import pytest
+from cachetools import TTLCache
+
+from app.services import user_validation
+from app.services.user_validation import CircuitBreaker, UserValidationService
+
+
+def _service(handler) -> UserValidationService:
+    """A UserValidationService whose client is served by `handler`."""
+    service = UserValidationService()
+    service._user_cache = TTLCache(maxsize=100, ttl=60)
+    service._client = httpx.AsyncClient(
+        base_url="http://user-service",
+        transport=httpx.MockTransport(handler),
+    )
+    return service
+
+
+def _slow_user_service(status_code: int):
+    """Handler answering every lookup after a short delay, counting calls."""
+    calls = []
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        await asyncio.sleep(0.05)
+        if status_code == 200:
+            return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1]})
+        return httpx.Response(status_code)
+    
+    return handler, calls
+
+
+@pytest.mark.parametrize("status_code, expected", [(200, {"id": "u1"}), (404, None)])
+def test_concurrent_misses_share_one_upstream_call(status_code, expected):
+    handler, calls = _slow_user_service(status_code)
+    service = _service(handler)
+    
+    async def lookup():
+        results = await asyncio.gather(*(service.get_user_by_id("u1") for _ in range(20)))
+        await service.aclose()
+        return results
+    
+    assert asyncio.run(lookup()) == [expected] * 20
+    assert calls == ["/internal/v1/users/u1"]
+    assert service._user_fetches == {}
+
+
+def test_cancelled_waiter_does_not_cancel_shared_fetch():
+    handler, calls = _slow_user_service(200)
+    service = _service(handler)
+    
+    async def lookup():
+        cancelled = asyncio.ensure_future(service.get_user_by_id("u1"))
+        waiting = asyncio.ensure_future(service.get_user_by_id("u1"))
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        result = await waiting
+        await service.aclose()
+        return cancelled, result
+    
+    cancelled, result = asyncio.run(lookup())
+    assert cancelled.cancelled()
+    assert result == {"id": "u1"}
+    assert calls == ["/internal/v1/users/u1"]
+
+
+def test_breaker_opens_after_threshold_and_half_opens_after_reset(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(user_validation.time, "monotonic", lambda: now[0])
+    breaker = CircuitBreaker(threshold=3, reset_seconds=30)
+    
+    for _ in range(2):
+        breaker.record_failure()
+    assert not breaker.is_open
+    breaker.record_failure()
+    assert breaker.is_open
+    
+    # After the reset period calls are let through again...
+    now[0] += 30
+    assert not breaker.is_open
+    # ...one more failure reopens it straight away...
+    breaker.record_failure()
+    assert breaker.is_open
+    # ...and a success closes it
+    now[0] += 30
+    breaker.record_success()
+    breaker.record_failure()
+    assert not breaker.is_open
+
+
+def test_breaker_disabled_with_zero_threshold():
+    breaker = CircuitBreaker(threshold=0, reset_seconds=30)
+    for _ in range(10):
+        breaker.record_failure()
+    assert not breaker.is_open